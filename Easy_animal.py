@@ -2,6 +2,10 @@
 # This will serve as a blueprint for all animals.
 
 class Animal:
+    # Every animal has exactly these attributes, so we declare them up front.
+    # With __slots__, objects use less memory and cannot grow new attributes.
+    __slots__ = ("name", "species")
+
     # The __init__ method initializes the attributes of an animal.
     def __init__(self, name, species):
         self.name = name  # Public attribute
@@ -18,6 +22,9 @@ class Animal:
 # Now, let's create specific types of animals that inherit from the Animal class.
 
 class Dog(Animal):
+    # A subclass lists only what it adds; name and species are inherited from Animal
+    __slots__ = ("breed",)
+
     def __init__(self, name, breed):
         super().__init__(name, "Dog")  # Calling the parent class's constructor
         self.breed = breed  # Additional attribute for dogs
@@ -27,6 +34,8 @@ class Dog(Animal):
         return f"{self.name} barks."
 
 class Cat(Animal):
+    __slots__ = ("color",)
+
     def __init__(self, name, color):
         super().__init__(name, "Cat")  # Calling the parent class's constructor
         self.color = color  # Additional attribute for cats
@@ -3,6 +3,11 @@
 # This will help explain the concept of a "class" and "object."
 
 class BankAccount:
+    # __slots__ lists the only attributes an account can have.
+    # Python then stores them in fixed slots instead of a per-object dictionary,
+    # which uses less memory and makes attribute access a bit faster.
+    __slots__ = ("account_holder", "balance")
+
     # The __init__ method is like a blueprint for creating objects.
     # It defines the attributes (balance) that each bank account will have.
     def __init__(self, account_holder, initial_balance):
@@ -27,13 +32,33 @@ class BankAccount:
 # Now, let's create a simple class for a savings account that inherits from BankAccount.
 
 class SavingsAccount(BankAccount):
+    # Only the attributes added here; account_holder and balance come from BankAccount
+    __slots__ = ("_interest_rate", "_growth")
+
     def __init__(self, account_holder, initial_balance, interest_rate):
         super().__init__(account_holder, initial_balance)
-        self.interest_rate = interest_rate  # Additional attribute for savings account
+        self.interest_rate = interest_rate  # Additional attribute; uses the setter below
+
+    # A property looks like a normal attribute from outside, but runs code when it is read or set.
+    @property
+    def interest_rate(self):
+        return self._interest_rate
+
+    # Growing by the interest rate is the same as multiplying by (1 + rate).
+    # We keep that factor next to the rate, so changing the rate also updates it.
+    @interest_rate.setter
+    def interest_rate(self, rate):
+        self._interest_rate = rate
+        self._growth = 1.0 + rate
 
     # Method to apply interest to the balance (this is unique to savings accounts)
     def apply_interest(self):
-        self.balance += self.balance * self.interest_rate
+        self.balance *= self._growth
+
+    # Method to apply interest for several periods at once.
+    # One power replaces a loop of n apply_interest calls.
+    def compound(self, n):
+        self.balance *= self._growth ** n
 
 #%%
 # Let's see how these classes work together.
@@ -61,4 +86,13 @@ print(f"Bob's Balance after interest: ${bob_savings.check_balance()}")
 #%%
 # Bob deposits $200 into his savings account
 bob_savings.deposit(200)
-print(f"Bob's Balance after deposit: ${bob_savings.check_balance()}")
\ No newline at end of file
+print(f"Bob's Balance after deposit: ${bob_savings.check_balance()}")
+#%%
+# Bob leaves his money for 10 more periods; compound applies them all at once
+bob_savings.compound(10)
+print(f"Bob's Balance after 10 more periods: ${bob_savings.check_balance():.2f}")
+#%%
+# The bank raises Bob's rate to 10%; the new rate applies from the next period on
+bob_savings.interest_rate = 0.10
+bob_savings.apply_interest()
+print(f"Bob's Balance after interest at the new rate: ${bob_savings.check_balance():.2f}")
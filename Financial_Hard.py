@@ -1,12 +1,209 @@
-from typing import List
+import math
+from typing import Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:  # numba is optional; fall back to plain Python
+    _HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Below this value of n * |y| the closed-form sums lose too much precision
+_CLOSED_FORM_MIN_YIELD = 1e-2
+
+# fastmath without nnan/ninf: keeps FMA contraction and reassociation but
+# leaves comparisons on NaN/Inf inputs well defined
+_FASTMATH = {"contract", "reassoc", "arcp"}
+
+
+def _cash_flow_vector(coupon: float, face: float, n: int) -> np.ndarray:
+    """
+    Cash flow schedule: n coupons plus the principal at maturity.
+    """
+    cash_flows = np.full(n, coupon, dtype=np.float64)
+    cash_flows[-1] += face  # principal repayment at maturity
+    return cash_flows
+
+
+def _pv_vector(y: float, n: int) -> np.ndarray:
+    """
+    Discount factors (1 + y)^-t for t = 1..n.
+    """
+    return (1 + y) ** -np.arange(1, n + 1, dtype=np.float64)
+
+
+def _series_sums_vectorized(
+    coupon: float, face: float, y: float, n: int
+) -> Tuple[float, float, float]:
+    """
+    NumPy version of _series_sums, used when numba is not installed.
+    """
+    t = np.arange(1, n + 1, dtype=np.float64)
+    cash_flows = _cash_flow_vector(coupon, face, n)
+    df = _pv_vector(y, n)
+
+    price = np.dot(cash_flows, df)
+    weighted_sum = np.dot(t * cash_flows, df)
+    convexity_sum = np.dot(cash_flows * t * (t + 1), df) / (1 + y) ** 2
+    return float(price), float(weighted_sum), float(convexity_sum)
+
+
+def _series_sums_loop(
+    coupon: float, face: float, y: float, n: int
+) -> Tuple[float, float, float]:
+    """
+    Period-by-period sums for yields too close to zero for the closed forms.
+
+    Returns (P, Σ t * PV(CF_t), Σ CF_t * t(t+1) / (1+y)^(t+2)).
+    Written as an explicit loop, which numba compiles better than the
+    equivalent array expressions.
+    """
+    v = 1 / (1 + y)
+    v2 = v * v
+    df = v  # v^t, updated by multiplication instead of a pow per period
+
+    price = 0.0
+    weighted_sum = 0.0
+    convexity_sum = 0.0
+
+    # Coupon-only periods, then the final coupon plus principal
+    # Weighted sums are written as a * b + acc so LLVM can emit FMAs
+    for t in range(1, n):
+        pv_cf = coupon * df
+        price += pv_cf
+        weighted_sum = t * pv_cf + weighted_sum
+        convexity_sum = (t * (t + 1) * v2) * pv_cf + convexity_sum
+        df *= v
+
+    pv_cf = (coupon + face) * df
+    price += pv_cf
+    weighted_sum += n * pv_cf
+    convexity_sum += n * (n + 1) * pv_cf * v2
+
+    return price, weighted_sum, convexity_sum
+
+
+if _HAS_NUMBA:
+    _series_sums = njit(
+        "UniTuple(f8, 3)(f8, f8, f8, i8)", cache=True, fastmath=_FASTMATH
+    )(_series_sums_loop)
+else:
+    _series_sums = _series_sums_vectorized
+
+
+@njit(
+    "UniTuple(f8, 4)(f8, f8, f8, i8, i8)", cache=True, fastmath=_FASTMATH
+)
+def _bond_kernel(
+    face: float, coupon_rate: float, y: float, n: int, m: int
+) -> Tuple[float, float, float, float]:
+    """
+    Computes price, Macaulay duration (years), modified duration and
+    convexity (years^2) of a fixed-coupon bond with periodic yield y,
+    n periods and m payments per year.
+
+    Uses the closed-form annuity sums, with v = 1 / (1 + y):
+
+    A  = Σ v^t          = (1 - v^n) / y
+    S1 = Σ t v^t        = ((1 + y) * A - n v^n) / y
+    S2 = Σ t(t+1) v^t   = (2 * S1 - n(n+1) v^(n+1)) / (1 - v)
+
+    P                   = C * A + F * v^n
+    Σ t * PV(CF_t)      = C * S1 + n F v^n
+    Σ CF_t t(t+1) v^(t+2) = v^2 * (C * S2 + n(n+1) F v^n)
+    """
+    coupon = face * coupon_rate / m
+
+    if n * abs(y) < _CLOSED_FORM_MIN_YIELD:
+        # The closed forms cancel catastrophically as y -> 0
+        price, weighted_sum, convexity_sum = _series_sums(coupon, face, y, n)
+    else:
+        log_growth = n * math.log1p(y)
+        vn = math.exp(-log_growth)
+        v = 1 / (1 + y)
+
+        annuity = -math.expm1(-log_growth) / y
+        s1 = ((1 + y) * annuity - n * vn) / y
+        s2 = (2 * s1 - n * (n + 1) * vn * v) / (y * v)
+
+        price = coupon * annuity + face * vn
+        weighted_sum = coupon * s1 + n * face * vn
+        convexity_sum = v * v * (coupon * s2 + n * (n + 1) * face * vn)
+
+    mac_dur = weighted_sum / price / m
+    mod_dur = mac_dur / (1 + y)
+    convexity = convexity_sum / price / (m * m)
+    return price, mac_dur, mod_dur, convexity
+
+
+@njit(
+    "void(f8[:], f8[:], f8[:], i8[:], i8[:], f8[:], f8[:], f8[:])",
+    parallel=True,
+    cache=True,
+    fastmath=_FASTMATH,
+)
+def _portfolio_kernel(
+    face: np.ndarray,
+    c_rate: np.ndarray,
+    ytm: np.ndarray,
+    nper: np.ndarray,
+    m: np.ndarray,
+    out_price: np.ndarray,
+    out_mac: np.ndarray,
+    out_conv: np.ndarray,
+) -> None:
+    """
+    Runs _bond_kernel for every bond, one bond per thread.
+    """
+    for b in prange(face.shape[0]):
+        price, mac_dur, _, convexity = _bond_kernel(
+            face[b], c_rate[b], ytm[b] / m[b], nper[b], m[b]
+        )
+        out_price[b] = price
+        out_mac[b] = mac_dur
+        out_conv[b] = convexity
+
+
+def _payment_schedule(
+    maturity_years: float, payments_per_year: float
+) -> Tuple[int, int]:
+    """
+    Returns (total periods, payments per year) as integers.
+    Both must be whole numbers and there must be at least one period.
+    """
+    total_periods = maturity_years * payments_per_year
+    if (
+        payments_per_year != int(payments_per_year)
+        or total_periods != int(total_periods)
+    ):
+        raise ValueError(
+            "Payments per year and total periods must be whole numbers."
+        )
+    if total_periods < 1:
+        raise ValueError("Bond must have at least one payment period.")
+    return int(total_periods), int(payments_per_year)
 
 
 class Calculator:
     """
     Base class providing generic mathematical operations.
     No finance-specific logic (SRP).
+
+    Meant for direct calls, not for analytic inner loops: the numeric
+    kernels use raw operators instead of a method call (and divide's
+    zero check) per step.
     """
 
+    __slots__ = ()
+
     def add(self, a: float, b: float) -> float:
         return a + b
 
@@ -31,6 +228,8 @@ class FinancialCalculator(Calculator):
     Still generic: no instrument-specific logic.
     """
 
+    __slots__ = ()
+
     def present_value(self, cash_flow: float, rate: float, period: int) -> float:
         """
         PV = CF / (1 + r)^t
@@ -50,8 +249,63 @@ class Bond(FinancialCalculator):
     """
     Represents a fixed-coupon bond and computes its analytics.
     Encapsulates all bond-specific attributes.
+
+    The analytics use raw arithmetic in _bond_kernel rather than the
+    inherited Calculator methods, which remain available to callers.
+
+    Price, duration and convexity are computed once in __init__, so the
+    bond's attributes are read-only properties: assigning to them (e.g.
+    bond.yield_to_maturity = 0.05), which earlier versions allowed,
+    raises AttributeError. Build a new Bond to change its terms.
     """
 
+    __slots__ = (
+        "_face_value",
+        "_coupon_rate",
+        "_yield_to_maturity",
+        "_maturity_years",
+        "_payments_per_year",
+        "_total_periods",
+        "_periodic_coupon",
+        "_periodic_yield",
+        "_price",
+        "_mac",
+        "_mod",
+        "_conv",
+    )
+
+    @property
+    def face_value(self) -> float:
+        return self._face_value
+
+    @property
+    def coupon_rate(self) -> float:
+        return self._coupon_rate
+
+    @property
+    def yield_to_maturity(self) -> float:
+        return self._yield_to_maturity
+
+    @property
+    def maturity_years(self) -> int:
+        return self._maturity_years
+
+    @property
+    def payments_per_year(self) -> int:
+        return self._payments_per_year
+
+    @property
+    def total_periods(self) -> int:
+        return self._total_periods
+
+    @property
+    def periodic_coupon(self) -> float:
+        return self._periodic_coupon
+
+    @property
+    def periodic_yield(self) -> float:
+        return self._periodic_yield
+
     def __init__(
         self,
         face_value: float,
@@ -60,35 +314,39 @@ class Bond(FinancialCalculator):
         maturity_years: int,
         payments_per_year: int = 1,
     ):
-        self.face_value = face_value
-        self.coupon_rate = coupon_rate
-        self.yield_to_maturity = yield_to_maturity
-        self.maturity_years = maturity_years
-        self.payments_per_year = payments_per_year
+        self._face_value = face_value
+        self._coupon_rate = coupon_rate
+        self._yield_to_maturity = yield_to_maturity
+        self._maturity_years = maturity_years
+        self._payments_per_year = payments_per_year
 
         # Derived attributes
-        self.total_periods = maturity_years * payments_per_year
-        self.periodic_coupon = (
+        n, m = _payment_schedule(maturity_years, payments_per_year)
+        self._total_periods = n
+        self._periodic_coupon = (
             face_value * coupon_rate / payments_per_year
         )
-        self.periodic_yield = yield_to_maturity / payments_per_year
+        self._periodic_yield = yield_to_maturity / payments_per_year
+        if not (
+            math.isfinite(self._periodic_yield) and self._periodic_yield > -1
+        ):
+            raise ValueError(
+                "Yield must be finite and yield / payments_per_year above -1."
+            )
 
-    def _cash_flows(self) -> List[float]:
-        """
-        Generates the bond's cash flow schedule.
-        """
-        cash_flows = [self.periodic_coupon] * self.total_periods
-        cash_flows[-1] += self.face_value  # principal repayment at maturity
-        return cash_flows
+        self._price, self._mac, self._mod, self._conv = _bond_kernel(
+            float(face_value),
+            float(coupon_rate),
+            float(self.periodic_yield),
+            n,
+            m,
+        )
 
     def price(self) -> float:
         """
         Bond Price = Sum of PV of all cash flows
         """
-        price = 0.0
-        for t, cf in enumerate(self._cash_flows(), start=1):
-            price += self.present_value(cf, self.periodic_yield, t)
-        return price
+        return self._price
 
     def macaulay_duration(self) -> float:
         """
@@ -96,23 +354,14 @@ class Bond(FinancialCalculator):
         D = Σ [ t * PV(CF_t) ] / Bond Price
         Expressed in years.
         """
-        bond_price = self.price()
-        weighted_sum = 0.0
-
-        for t, cf in enumerate(self._cash_flows(), start=1):
-            pv_cf = self.present_value(cf, self.periodic_yield, t)
-            weighted_sum += t * pv_cf
-
-        duration_in_periods = weighted_sum / bond_price
-        return duration_in_periods / self.payments_per_year
+        return self._mac
 
     def modified_duration(self) -> float:
         """
         Modified Duration:
         D_mod = D_mac / (1 + y / m)
         """
-        mac_dur = self.macaulay_duration()
-        return mac_dur / (1 + self.periodic_yield)
+        return self._mod
 
     def convexity(self) -> float:
         """
@@ -121,31 +370,168 @@ class Bond(FinancialCalculator):
         C = (1 / P) * Σ [ CF_t * t(t+1) / (1+y)^(t+2) ]
         Adjusted for payment frequency.
         """
-        bond_price = self.price()
-        convexity_sum = 0.0
+        return self._conv
 
-        for t, cf in enumerate(self._cash_flows(), start=1):
-            discount = self.power(1 + self.periodic_yield, t + 2)
-            convexity_sum += cf * t * (t + 1) / discount
+    def price_curve(self, delta_yields: np.ndarray) -> np.ndarray:
+        """
+        Approximates percentage price change for a vector of yield shocks
+        using duration + convexity.
 
-        # Convert from periods^2 to years^2
-        return convexity_sum / bond_price / (self.payments_per_year ** 2)
+        ΔP / P ≈ -D_mod * Δy + 0.5 * Conv * (Δy)^2
+        """
+        d_mod, conv = self._mod, self._conv
+        delta_yields = np.asarray(delta_yields, dtype=np.float64)
 
+        return (
+            -d_mod * delta_yields
+            + 0.5 * conv * (delta_yields ** 2)
+        )
 
     def price_percentage_change(self, delta_yield: float) -> float:
         """
-        Approximates percentage price change using
-        duration + convexity.
+        Approximates percentage price change for a single yield shock.
+        See price_curve.
+        """
+        return float(self.price_curve(np.array([delta_yield]))[0])
 
-        ΔP / P ≈ -D_mod * Δy + 0.5 * Conv * (Δy)^2
+    @classmethod
+    def ytm_from_price(
+        cls,
+        face_value: float,
+        coupon_rate: float,
+        maturity_years: int,
+        market_price: float,
+        payments_per_year: int = 1,
+        tol: float = 1e-10,
+        max_iterations: int = 50,
+    ) -> float:
         """
-        d_mod = self.modified_duration()
-        conv = self.convexity()
+        Solves for the yield to maturity that reproduces market_price.
 
-        return (
-            -d_mod * delta_yield
-            + 0.5 * conv * (delta_yield ** 2)
+        Newton's method on g(u) = ln P(u) - ln market_price, where
+        u = ln(1 + y/m) and the analytic derivative comes from the
+        closed-form kernel:
+
+        dg/du = -D_mac * m
+        u_(k+1) = u_k + (ln P(u_k) - ln market_price) / (D_mac(u_k) * m)
+
+        ln P is convex and decreasing in u, so the iteration converges
+        from any start, and every u maps to a valid yield y/m > -1.
+        """
+        if market_price <= 0:
+            raise ValueError("Market price must be positive.")
+
+        n, m = _payment_schedule(maturity_years, payments_per_year)
+
+        # Start from the usual approximate-yield formula
+        annual_coupon = face_value * coupon_rate
+        pull_to_par = (face_value - market_price) / maturity_years
+        ytm = (annual_coupon + pull_to_par) / ((face_value + market_price) / 2)
+        u = math.log1p(ytm / m) if ytm / m > -1 else 0.0
+        log_target = math.log(market_price)
+
+        for _ in range(max_iterations):
+            price, mac_dur, _, _ = _bond_kernel(
+                float(face_value), float(coupon_rate), math.expm1(u), n, m
+            )
+            if not (math.isfinite(price) and price > 0):
+                break
+            u += (math.log(price) - log_target) / (mac_dur * m)
+            new_ytm = m * math.expm1(u)
+            if abs(new_ytm - ytm) < tol:
+                return new_ytm
+            ytm = new_ytm
+
+        raise ValueError("Yield to maturity did not converge.")
+
+
+def price_portfolio(
+    face_value: ArrayLike,
+    coupon_rate: ArrayLike,
+    yield_to_maturity: ArrayLike,
+    maturity_years: ArrayLike,
+    payments_per_year: ArrayLike = 1,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Prices a portfolio of fixed-coupon bonds in one batched call.
+
+    Each argument holds one value per bond (scalars are broadcast).
+    As for Bond, payments per year and total periods must be whole
+    numbers, with at least one period per bond.
+    Returns (price, Macaulay duration, convexity) arrays in the same
+    units as Bond.price, Bond.macaulay_duration and Bond.convexity.
+    """
+    inputs = (
+        face_value,
+        coupon_rate,
+        yield_to_maturity,
+        maturity_years,
+        payments_per_year,
+    )
+    # Copy out of the broadcast views: the compiled kernel's signature
+    # expects writable float64 arrays
+    face, c_rate, ytm, maturity, m = (
+        np.array(a, dtype=np.float64)
+        for a in np.broadcast_arrays(*(np.atleast_1d(a) for a in inputs))
+    )
+    if face.size == 0:
+        raise ValueError("Portfolio must contain at least one bond.")
+    total_periods = maturity * m
+    if (
+        (m != np.floor(m)).any()
+        or (total_periods != np.floor(total_periods)).any()
+    ):
+        raise ValueError(
+            "Payments per year and total periods must be whole numbers."
         )
+    n = total_periods.astype(np.int64)
+    if (n < 1).any():
+        raise ValueError("Every bond must have at least one payment period.")
+
+    y = ytm / m
+    if not (np.isfinite(y) & (y > -1)).all():
+        raise ValueError(
+            "Yield must be finite and yield / payments_per_year above -1."
+        )
+
+    if _HAS_NUMBA:
+        m = m.astype(np.int64)
+        price = np.empty(n.size)
+        mac_dur = np.empty(n.size)
+        convexity = np.empty(n.size)
+        _portfolio_kernel(face, c_rate, ytm, n, m, price, mac_dur, convexity)
+        return price, mac_dur, convexity
+
+    return _price_portfolio_vectorized(face, c_rate, ytm, n, m)
+
+
+def _price_portfolio_vectorized(
+    face: np.ndarray,
+    c_rate: np.ndarray,
+    ytm: np.ndarray,
+    n: np.ndarray,
+    m: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    NumPy version of _portfolio_kernel, used when numba is not installed.
+    """
+    y = ytm / m
+
+    # Bonds with fewer periods than the longest one are masked
+    t = np.arange(1, n.max() + 1, dtype=np.float64)[None, :]
+    df = (1 + y)[:, None] ** -t
+    cash_flows = np.where(t <= n[:, None], (face * c_rate / m)[:, None], 0.0)
+    cash_flows[np.arange(n.size), n - 1] += face  # principal at maturity
+
+    pv = cash_flows * df
+    price = pv.sum(axis=1)
+    weighted_sum = (t * pv).sum(axis=1)
+    convexity_sum = (t * (t + 1) * pv).sum(axis=1) / (1 + y) ** 2
+
+    mac_dur = weighted_sum / price / m
+    convexity = convexity_sum / price / (m * m)
+    return price, mac_dur, convexity
+
 
 if __name__ == "__main__":
     bond = Bond(
@@ -162,3 +548,50 @@ if __name__ == "__main__":
     delta_y = 0.01  # 1% yield increase
     pct_change = bond.price_percentage_change(delta_y)
     print(f"Approximate Price Change for 1% yield increase: {pct_change * 100:.2f}%")
+
+    shocks = np.array([-0.02, -0.01, 0.01, 0.02])
+    for dy, change in zip(shocks, bond.price_curve(shocks)):
+        print(f"Approximate Price Change for {dy * 100:+.0f}% yield shock: {change * 100:.2f}%")
+
+    implied_ytm = Bond.ytm_from_price(
+        face_value=1000,
+        coupon_rate=0.06,
+        maturity_years=5,
+        market_price=bond.price(),
+    )
+    print(f"Yield to Maturity implied by price: {implied_ytm * 100:.4f}%")
+
+    # Round trip: ytm_from_price must recover the yield of its own prices,
+    # including zero coupons, long maturities and high or negative yields
+    for coupon_rate in (0.0, 0.05, 0.2):
+        for maturity_years in (1, 30, 100):
+            for payments_per_year in (1, 12):
+                for ytm in (-0.005, 0.0, 0.03, 0.5, 2.0):
+                    price = Bond(
+                        1000, coupon_rate, ytm, maturity_years, payments_per_year
+                    ).price()
+                    recovered = Bond.ytm_from_price(
+                        1000, coupon_rate, maturity_years, price, payments_per_year
+                    )
+                    assert abs(recovered - ytm) < 1e-8 * max(1, abs(ytm))
+
+    # Ragged portfolio: both price_portfolio paths must agree with Bond
+    face = np.array([1000.0, 500.0, 100.0, 1000.0])
+    coupon = np.array([0.05, 0.08, 0.0, 0.07])
+    ytm = np.array([0.04, 0.12, 0.03, 1e-7])
+    maturity = np.array([30.0, 5.0, 10.0, 2.0])
+    m = np.array([12.0, 1.0, 2.0, 4.0])
+
+    expected = np.array([
+        [b.price(), b.macaulay_duration(), b.convexity()]
+        for b in map(Bond, face, coupon, ytm, maturity, m)
+    ]).T
+    n = (maturity * m).astype(np.int64)
+    for result in (
+        price_portfolio(face, coupon, ytm, maturity, m),
+        _price_portfolio_vectorized(face, coupon, ytm, n, m),
+    ):
+        np.testing.assert_allclose(result, expected, rtol=1e-10)
+
+    prices, _, _ = price_portfolio(face, coupon, ytm, maturity, m)
+    print(f"Portfolio Prices: {np.round(prices, 2)}")